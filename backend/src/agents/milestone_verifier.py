@@ -5,13 +5,25 @@ Integrates with ASI Alliance ecosystem for AI-powered milestone verification
 """
 
 import asyncio
+import heapq
+import importlib.util
+import itertools
 import json
 import logging
+import math
 import os
+import queue
+import re
+import sqlite3
 import sys
-from typing import Dict, List, Optional, Any
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field, asdict, replace
+from typing import Dict, List, Optional, Any, Tuple, Callable, Awaitable, Union, Sequence
 from datetime import datetime
 from dotenv import load_dotenv
+import numpy as np
 
 # Load environment variables from .env file
 load_dotenv()
@@ -28,7 +40,8 @@ class Context:
         self.address = f"agent_{agent.name}_{hash(agent.name) % 1000000}"
 
     async def send(self, recipient: str, message: dict):
-        logger.info(f"Agent {self.agent.name} sending message to {recipient}: {message}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Agent %s sending message to %s: %s", self.agent.name, recipient, message)
 
 class Model:
     def __init__(self, **kwargs):
@@ -74,23 +87,11 @@ class Agent:
             logger.info(f"Agent {self.name} stopped.")
 
 # Real imports
-import requests
+import httpx
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
-# Try to import web3, fallback if not available
-try:
-    from web3 import Web3
-    WEB3_AVAILABLE = True
-except ImportError:
-    WEB3_AVAILABLE = False
-    class HTTPProvider:
-        def __init__(self, url):
-            self.url = url
-    class Web3:
-        HTTPProvider = HTTPProvider
-        def __init__(self, provider):
-            self.provider = provider
-        def is_connected(self):
-            return False
+# HTTP/2 support for httpx requires the optional h2 package (checked without importing it)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 # Try to import MeTTaClient, fallback to mock if not available
 try:
@@ -111,6 +112,23 @@ except ImportError:
                 "metadata": {}
             }
 
+# Try to import orjson for faster JSON encoding, fallback to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+
+    def json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY)
+
+    json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
+    json_loads = json.loads
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -118,6 +136,600 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ASI:One chat protocol path, relative to ASI_ENDPOINT
+ASI_CHAT_PATH = "/chat/agent"
+
+# MeTTa knowledge graph context (and analysis type) for evidence queries
+METTA_CONTEXT = "milestone_verification"
+
+# Constant parts of the mock agent response
+_MOCK_RECOMMENDATIONS = (
+    "Consider providing more detailed evidence",
+    "Ensure milestone deliverables are clearly defined"
+)
+_MOCK_REASONING = "Mock agent analysis: Description length={}, Evidence relevance={:.2f}".format
+
+# Final score weights: evidence analysis counts 40% (relevance 40%, completeness 30%,
+# authenticity 30% of it) and the agent confidence 60%
+EVIDENCE_WEIGHT = 0.4
+AGENT_WEIGHT = 0.6
+
+def _combined_score(relevance, completeness, authenticity, agent_confidence):
+    """
+    Final confidence for scalars or NumPy arrays
+
+    Evaluated in two stages, evidence score first, so every scoring path
+    rounds exactly like the others.
+    """
+    evidence_score = relevance * 0.4 + completeness * 0.3 + authenticity * 0.3
+    return evidence_score * EVIDENCE_WEIGHT + agent_confidence * AGENT_WEIGHT
+
+# Verdict codes returned by score_batch, indexing VERDICT_LABELS
+VERDICT_APPROVED, VERDICT_REJECTED, VERDICT_UNCERTAIN = 0, 1, 2
+VERDICT_LABELS = ("approved", "rejected", "uncertain")
+
+def _compile_score_batch():
+    """
+    Compile the numba batch scoring kernel, fallback to vectorized NumPy
+
+    The kernel is compiled here for the arrays combine_results_batch builds
+    rather than on its first real batch. It is serial: batches are at most
+    BATCH_MAX_SIZE rows, too few to pay for a thread pool, and numba's
+    parallel backend cannot be compiled outside the main thread without
+    hanging interpreter exit.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _score_batch_numpy
+
+    combined_score = njit(inline='always')(_combined_score)
+
+    @njit
+    def score_batch_kernel(scores, approved, threshold):
+        n = scores.shape[0]
+        confidences = np.empty(n)
+        verdicts = np.empty(n, dtype=np.int8)
+        for i in range(n):
+            confidence = combined_score(scores[i, 0], scores[i, 1], scores[i, 2], scores[i, 3])
+            confidences[i] = confidence
+            if confidence >= threshold and approved[i]:
+                verdicts[i] = VERDICT_APPROVED
+            elif confidence < 1 - threshold or not approved[i]:
+                verdicts[i] = VERDICT_REJECTED
+            else:
+                verdicts[i] = VERDICT_UNCERTAIN
+        return confidences, verdicts
+
+    score_batch_kernel.compile("(float64[:, ::1], boolean[::1], float64)")
+    return score_batch_kernel
+
+def _score_batch_numpy(scores, approved, threshold):
+    confidences = _combined_score(scores[:, 0], scores[:, 1], scores[:, 2], scores[:, 3])
+    verdicts = np.where(
+        (confidences >= threshold) & approved,
+        VERDICT_APPROVED,
+        np.where((confidences < 1 - threshold) | ~approved, VERDICT_REJECTED, VERDICT_UNCERTAIN)
+    ).astype(np.int8)
+    return confidences, verdicts
+
+_score_batch_impl = None
+
+def score_batch(scores: np.ndarray, approved: np.ndarray,
+                threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score an (N, 4) array of (relevance, completeness, authenticity, agent confidence)
+    rows with the same weights and verdict rules as combine_results
+
+    numba is only imported on first use to keep agent start-up fast; await
+    prepare_score_batch() first to compile off the event loop.
+
+    Returns:
+        Tuple of (confidences, verdict codes indexing VERDICT_LABELS)
+    """
+    global _score_batch_impl
+    if _score_batch_impl is None:
+        _score_batch_impl = _compile_score_batch()
+    return _score_batch_impl(scores, approved, threshold)
+
+async def prepare_score_batch():
+    """Compile the batch scoring kernel in a worker thread"""
+    global _score_batch_impl
+    if _score_batch_impl is None:
+        _score_batch_impl = await asyncio.to_thread(_compile_score_batch)
+
+@dataclass(slots=True, frozen=True)
+class EvidenceAnalysis:
+    """Evidence analysis produced by the MeTTa knowledge graph"""
+    relevance: float = 0.5
+    completeness: float = 0.5
+    authenticity: float = 0.5
+    reasoning: str = "Evidence analysis completed"
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    fallback: bool = False  # produced by the mock client or the error path
+
+@dataclass(slots=True, frozen=True)
+class AgentVerdict:
+    """Verdict returned by the ASI:One agent"""
+    approved: bool = False
+    confidence: float = 0.5
+    reasoning: str = "Agent analysis completed"
+    recommendations: Sequence[str] = ()
+    fallback: bool = False  # produced by the mock response or the error path
+
+@dataclass(slots=True, frozen=True)
+class FinalResult:
+    """Final milestone verification result"""
+    verdict: str
+    confidence: float
+    reasoning: str
+    evidence_analysis: Optional[EvidenceAnalysis] = None
+    agent_verdict: Optional[AgentVerdict] = None
+    error: Optional[str] = None
+    cached: bool = False
+
+    @property
+    def from_fallback(self) -> bool:
+        """Whether any part of the result came from a mock or error fallback"""
+        return (
+            self.evidence_analysis is None or self.agent_verdict is None or
+            self.evidence_analysis.fallback or self.agent_verdict.fallback
+        )
+
+    def to_dict(self) -> Dict:
+        """Serialize to the verification result message format"""
+        result = {
+            "verdict": self.verdict,
+            "confidence": self.confidence,
+            "reasoning": self.reasoning
+        }
+        if self.evidence_analysis is not None and self.agent_verdict is not None:
+            result["details"] = {
+                "evidence_analysis": asdict(self.evidence_analysis),
+                "agent_verdict": asdict(self.agent_verdict),
+                "combined_score": self.confidence
+            }
+        if self.error is not None:
+            result["error"] = self.error
+        if self.cached:
+            result["cached"] = True
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FinalResult":
+        """Rebuild a result from the verification result message format"""
+        details = data.get("details") or {}
+        evidence_analysis = details.get("evidence_analysis")
+        agent_verdict = details.get("agent_verdict")
+        return cls(
+            verdict=data["verdict"],
+            confidence=data["confidence"],
+            reasoning=data["reasoning"],
+            evidence_analysis=EvidenceAnalysis(**evidence_analysis) if evidence_analysis is not None else None,
+            agent_verdict=AgentVerdict(**agent_verdict) if agent_verdict is not None else None,
+            error=data.get("error"),
+            cached=data.get("cached", False)
+        )
+
+class SemanticCache:
+    """
+    Semantic cache for milestone verification results
+
+    Entries are scoped per (campaign_address, milestone_id, evidence_hash) and matched on the
+    cosine similarity of milestone description embeddings.
+    """
+
+    HASH_EMBEDDING_DIM = 256
+
+    def __init__(self, threshold: float = 0.92, ttl_seconds: float = 3600.0,
+                 max_entries: int = 10000, model_name: Optional[str] = None):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._encoder = None
+        self.model_id = f"hashed-bow-{self.HASH_EMBEDDING_DIM}"
+        if model_name:
+            # Imported here since sentence-transformers pulls in torch; fallback to hashed tokens
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._encoder = SentenceTransformer(model_name)
+                self.model_id = model_name
+            except Exception as e:
+                logger.warning(f"Failed to load embedding model {model_name}, using hashed embeddings: {e}")
+
+        # entry_id -> (scope, embedding, final_result, model_id, ts)
+        self._entries: Dict[int, Tuple[Tuple[Any, Any, Any], List[float], FinalResult, str, float]] = {}
+        self._scopes: Dict[Tuple[Any, Any, Any], List[int]] = {}
+        self._expiry: List[Tuple[float, int]] = []
+        self._ids = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def embed(self, text: str) -> List[float]:
+        """
+        Embed text into a unit-length vector
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Normalized embedding vector
+        """
+        if self._encoder is not None:
+            vector = await asyncio.to_thread(self._encoder.encode, text, normalize_embeddings=True)
+            return [float(x) for x in vector]
+        return self._hash_embed(text)
+
+    def _hash_embed(self, text: str) -> List[float]:
+        """Hashed bag-of-words embedding used when no embedding model is available"""
+        vector = [0.0] * self.HASH_EMBEDDING_DIM
+        for token in re.findall(r"\w+", text.lower()):
+            vector[zlib.crc32(token.encode()) % self.HASH_EMBEDDING_DIM] += 1.0
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else vector
+
+    def lookup(self, scope: Tuple[Any, Any, Any], embedding: List[float]) -> Optional[FinalResult]:
+        """
+        Find the closest cached result within a scope
+
+        Args:
+            scope: (campaign_address, milestone_id, evidence_hash) the result must belong to
+            embedding: Normalized description embedding
+
+        Returns:
+            Cached final result if similarity exceeds the threshold, else None
+        """
+        self._evict_expired(time.monotonic())
+
+        best_score = -1.0
+        best_result = None
+        for entry_id in self._scopes.get(scope, ()):
+            _, cached_embedding, result, model_id, _ = self._entries[entry_id]
+            if model_id != self.model_id:
+                continue
+            score = sum(a * b for a, b in zip(embedding, cached_embedding))
+            if score > best_score:
+                best_score, best_result = score, result
+
+        if best_result is not None and best_score > self.threshold:
+            return best_result
+        return None
+
+    def store(self, scope: Tuple[Any, Any, Any], embedding: List[float], result: FinalResult,
+              ttl_seconds: Optional[float] = None):
+        """
+        Store a verification result
+
+        Args:
+            scope: (campaign_address, milestone_id, evidence_hash) the result belongs to
+            embedding: Normalized description embedding
+            result: Final verification result
+            ttl_seconds: Remaining lifetime, defaults to the cache TTL
+        """
+        now = time.monotonic()
+        self._evict_expired(now)
+        while len(self._entries) >= self.max_entries and self._expiry:
+            _, oldest_id = heapq.heappop(self._expiry)
+            self._remove(oldest_id)
+
+        entry_id = next(self._ids)
+        self._entries[entry_id] = (scope, embedding, result, self.model_id, now)
+        self._scopes.setdefault(scope, []).append(entry_id)
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        heapq.heappush(self._expiry, (now + ttl, entry_id))
+
+    def _evict_expired(self, now: float):
+        while self._expiry and self._expiry[0][0] <= now:
+            _, entry_id = heapq.heappop(self._expiry)
+            self._remove(entry_id)
+
+    def _remove(self, entry_id: int):
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return
+        scope_ids = self._scopes.get(entry[0])
+        if scope_ids is not None:
+            scope_ids.remove(entry_id)
+            if not scope_ids:
+                del self._scopes[entry[0]]
+
+def is_retryable_asi_error(error: BaseException) -> bool:
+    """Transport errors, timeouts, rate limiting and 5xx responses are worth retrying"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return isinstance(error, (httpx.TransportError, asyncio.TimeoutError))
+
+class CircuitBreaker:
+    """
+    Circuit breaker for an unreliable backend
+
+    Opens after fail_max consecutive failures and rejects calls until
+    reset_timeout seconds have passed, then lets a single trial call through.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow_request(self) -> bool:
+        """Whether a call may be attempted right now"""
+        if self._opened_at is None:
+            return True
+        if not self._trial_in_flight and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self.fail_max:
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def release_trial(self):
+        """Give up a call that ended without an outcome, e.g. on cancellation"""
+        self._trial_in_flight = False
+
+class PersistentResultStore:
+    """
+    On-disk store for semantic cache entries
+
+    Writes are queued to a background thread that commits them in batches,
+    one transaction per batch, so disk syncs never stall the event loop.
+    Completion is signalled back to the submitting loop through the future
+    returned by put(). Entries are read once, to warm the cache at startup.
+    """
+
+    def __init__(self, path: str, max_batch: int = 64):
+        self.path = path
+        self.max_batch = max_batch
+
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS verification_results ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " campaign_address TEXT,"
+                " milestone_id TEXT,"
+                " evidence_hash TEXT,"
+                " model_id TEXT NOT NULL,"
+                " embedding BLOB NOT NULL,"
+                " result BLOB NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_verification_results_expires_at"
+                " ON verification_results (expires_at)"
+            )
+
+        self._writes: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="result-store-writer", daemon=True)
+        self._writer.start()
+
+    def load(self, model_id: str, limit: int) -> List[Tuple[Tuple[Any, Any, Any], List[float], FinalResult, float]]:
+        """
+        Read unexpired entries for an embedding model, newest last
+
+        Args:
+            model_id: Embedding model the entries must have been stored with
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of (scope, embedding, final_result, expires_at) tuples
+        """
+        with sqlite3.connect(self.path) as conn:
+            rows = conn.execute(
+                "SELECT campaign_address, milestone_id, evidence_hash, embedding, result, expires_at"
+                " FROM verification_results WHERE model_id = ? AND expires_at > ?"
+                " ORDER BY id DESC LIMIT ?",
+                (model_id, time.time(), limit)
+            ).fetchall()
+
+        return [
+            (
+                (campaign_address, milestone_id, evidence_hash),
+                np.frombuffer(embedding, dtype=np.float64).tolist(),
+                FinalResult.from_dict(json_loads(result)),
+                expires_at
+            )
+            for campaign_address, milestone_id, evidence_hash, embedding, result, expires_at in reversed(rows)
+        ]
+
+    def put(self, scope: Tuple[Any, Any, Any], embedding: List[float], result: FinalResult,
+            model_id: str, expires_at: float) -> asyncio.Future:
+        """
+        Queue an entry for the background writer
+
+        Args:
+            scope: (campaign_address, milestone_id, evidence_hash) the result belongs to
+            embedding: Normalized description embedding
+            result: Final verification result
+            model_id: Embedding model that produced the embedding
+            expires_at: Wall-clock expiry time
+
+        Returns:
+            Future resolved once the entry is committed
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        row = (
+            *scope,
+            model_id,
+            np.asarray(embedding, dtype=np.float64).tobytes(),
+            json_dumps(result.to_dict()),
+            expires_at
+        )
+        self._writes.put((row, loop, future))
+        return future
+
+    def close(self):
+        """Flush queued writes and stop the writer thread (blocking)"""
+        self._writes.put(None)
+        self._writer.join()
+
+    def _write_loop(self):
+        conn = sqlite3.connect(self.path)
+        try:
+            while True:
+                item = self._writes.get()
+                if item is None:
+                    return
+                batch = [item]
+                stopping = False
+                while len(batch) < self.max_batch:
+                    try:
+                        item = self._writes.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+
+                error = None
+                try:
+                    with conn:
+                        conn.executemany(
+                            "INSERT INTO verification_results"
+                            " (campaign_address, milestone_id, evidence_hash, model_id, embedding, result, expires_at)"
+                            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            [row for row, _, _ in batch]
+                        )
+                        conn.execute("DELETE FROM verification_results WHERE expires_at <= ?", (time.time(),))
+                except Exception as e:
+                    error = e
+
+                for _, loop, future in batch:
+                    if not loop.is_closed():
+                        loop.call_soon_threadsafe(self._resolve, future, error)
+
+                if stopping:
+                    return
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, error: Optional[Exception]):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(None)
+
+class BatchingClient:
+    """
+    Coalesces concurrent submissions into batched backend calls
+
+    Payloads queued within the batching window (up to max_batch of them) are
+    sent together through send_batch, which must return one result per
+    payload in the same order. A result that is an exception fails only its
+    own submission.
+    """
+
+    def __init__(self, send_batch: Callable[[List[Any]], Awaitable[List[Any]]],
+                 max_batch: int = 8, batch_window_ms: float = 10.0):
+        self.send_batch = send_batch
+        self.max_batch = max_batch
+        self.batch_window = batch_window_ms / 1000.0
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatches = set()
+        self._pending = set()
+
+    async def submit(self, payload: Any) -> Any:
+        """
+        Queue a payload for the next batch and wait for its result
+
+        Args:
+            payload: Single request payload
+
+        Returns:
+            Result for this payload
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._collect())
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        await self._queue.put((payload, future))
+        return await future
+
+    async def _collect(self):
+        while True:
+            batch = [await self._queue.get()]
+            if self.max_batch > 1:
+                await asyncio.sleep(self.batch_window)
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            # Dispatch without waiting so slow backend calls don't hold up the next window
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        batch = [(payload, future) for payload, future in batch if not future.done()]
+        if not batch:
+            return
+
+        try:
+            results = await self.send_batch([payload for payload, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch returned {len(results)} results for {len(batch)} requests")
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, asyncio.CancelledError):
+                future.cancel()
+            elif isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self):
+        """Stop batching and cancel any pending submissions"""
+        tasks = list(self._dispatches)
+        if self._worker is not None:
+            tasks.append(self._worker)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker = None
+        self._queue = None
+
+        # Includes batches taken off the queue but not yet, or only partly, sent
+        for future in list(self._pending):
+            future.cancel()
+
 class MilestoneVerifierAgent:
     """
     ASI Agent for verifying crowdfunding campaign milestones
@@ -133,13 +745,75 @@ class MilestoneVerifierAgent:
         self.metta_client = MeTTaClient(
             endpoint=os.getenv('METTA_KNOWLEDGE_GRAPH_URL', 'https://metta.asi.one')
         )
-        
-        # Web3 connection
-        self.web3 = Web3(Web3.HTTPProvider(os.getenv('ETH_RPC_URL')))
+        self._metta_session = None
+        self._metta_session_lock = asyncio.Lock()
         
         # Configuration
         self.confidence_threshold = float(os.getenv('CONFIDENCE_THRESHOLD', '0.8'))
         self.max_retry_attempts = int(os.getenv('MAX_RETRY_ATTEMPTS', '3'))
+        self.max_concurrent_verifications = int(os.getenv('MAX_CONCURRENT_VERIFICATIONS', '32'))
+        self._verification_slots = asyncio.Semaphore(self.max_concurrent_verifications)
+        self.parallel_verification = os.getenv('PARALLEL_VERIFICATION', 'false').lower() == 'true'
+
+        # ASI:One chat endpoint (real endpoint for hackathon prize eligibility) and auth headers
+        self._asi_base_url = os.getenv('ASI_ENDPOINT', 'https://api.asi.one').rstrip('/')
+        self._asi_endpoint = self._asi_base_url + ASI_CHAT_PATH
+        self._asi_api_key = os.getenv('ASI_API_KEY')
+        self._asi_headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "AutoCrowd-MilestoneVerifier/1.0"
+        }
+        if self._asi_api_key:
+            self._asi_headers["Authorization"] = f"Bearer {self._asi_api_key}"
+            self._asi_headers["X-API-Key"] = self._asi_api_key  # Additional auth header
+
+        # Semantic cache for repeated milestone verifications
+        self.semantic_cache = None
+        if os.getenv('SEMANTIC_CACHE_ENABLED', 'false').lower() == 'true':
+            self.semantic_cache = SemanticCache(
+                threshold=float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.92')),
+                ttl_seconds=float(os.getenv('SEMANTIC_CACHE_TTL', '3600')),
+                max_entries=int(os.getenv('SEMANTIC_CACHE_MAX_ENTRIES', '10000')),
+                model_name=os.getenv('SEMANTIC_CACHE_MODEL')
+            )
+
+        # Optional on-disk persistence so cached verification results survive restarts
+        self.result_store = None
+        result_store_path = os.getenv('RESULT_STORE_PATH')
+        if self.semantic_cache is not None and result_store_path:
+            self.result_store = PersistentResultStore(result_store_path)
+            now = time.time()
+            entries = self.result_store.load(self.semantic_cache.model_id, self.semantic_cache.max_entries)
+            for scope, embedding, result, expires_at in entries:
+                if not result.from_fallback:
+                    self.semantic_cache.store(scope, embedding, result, ttl_seconds=expires_at - now)
+            logger.info("Loaded %d persisted verification results from %s", len(entries), result_store_path)
+
+        # Verifications currently running, keyed by (campaign_address, milestone_id, evidence_hash)
+        self._inflight: Dict[Tuple[Any, Any, Any], "asyncio.Task[FinalResult]"] = {}
+
+        # Shared ASI:One HTTP client (created lazily once an event loop is running)
+        self._http: Optional[httpx.AsyncClient] = None
+
+        # Short-circuit to the mock response while ASI:One keeps failing
+        self._asi_breaker = CircuitBreaker(
+            fail_max=int(os.getenv('CIRCUIT_BREAKER_FAIL_MAX', '5')),
+            reset_timeout=float(os.getenv('CIRCUIT_BREAKER_RESET_TIMEOUT', '30'))
+        )
+
+        # Optional request batching for MeTTa queries and ASI:One chat calls
+        max_batch = int(os.getenv('BATCH_MAX_SIZE', '8'))
+        batch_window_ms = float(os.getenv('BATCH_WINDOW_MS', '10'))
+        self._metta_batcher = None
+        if os.getenv('METTA_BATCH_ENABLED', 'false').lower() == 'true':
+            self._metta_batcher = BatchingClient(self._query_metta_batch, max_batch, batch_window_ms)
+        self._asi_batcher = None
+        if os.getenv('ASI_BATCH_ENABLED', 'false').lower() == 'true':
+            self._asi_batcher = BatchingClient(self._post_asi_chat_batch, max_batch, batch_window_ms)
+        # Verifications arriving together are scored in one score_batch pass
+        self._verification_batcher = None
+        if os.getenv('VERIFICATION_BATCH_ENABLED', 'false').lower() == 'true':
+            self._verification_batcher = BatchingClient(self._verify_milestone_batch, max_batch, batch_window_ms)
         
         # Register message handlers
         self.setup_handlers()
@@ -150,7 +824,8 @@ class MilestoneVerifierAgent:
         async def handle_verification_request(ctx: Context, sender: str, msg: Dict):
             """Handle milestone verification requests"""
             try:
-                logger.info(f"Received verification request from {sender}: {msg}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Received verification request from %s: %s", sender, msg)
 
                 # Process verification request
                 result = await self.verify_milestone(msg)
@@ -159,12 +834,12 @@ class MilestoneVerifierAgent:
                 await ctx.send(sender, {
                     "type": "verification_result",
                     "request_id": msg.get("request_id"),
-                    "result": result,
+                    "result": result.to_dict(),
                     "timestamp": datetime.utcnow().isoformat()
                 })
 
             except Exception as e:
-                logger.error(f"Error processing verification request: {e}")
+                logger.error("Error processing verification request: %s", e)
                 await ctx.send(sender, {
                     "type": "verification_error",
                     "request_id": msg.get("request_id"),
@@ -174,18 +849,149 @@ class MilestoneVerifierAgent:
 
         self.handle_verification_request = handle_verification_request
     
-    async def verify_milestone(self, request: Dict) -> Dict:
+    async def verify_milestone(self, request: Dict) -> FinalResult:
         """
         Verify a milestone submission using ASI ecosystem
+
+        Concurrent requests for the same milestone and evidence share a single
+        in-flight verification. With verification batching enabled, distinct
+        requests arriving within the batching window are verified together.
         
         Args:
             request: Verification request containing milestone data
             
         Returns:
-            Dict containing verification result
+            FinalResult containing verification result
+        """
+        key = self._verification_key(request)
+        task = self._inflight.get(key)
+        if task is None:
+            if self._verification_batcher is not None:
+                verification = self._verification_batcher.submit(request)
+            else:
+                verification = self._verify_milestone(request)
+            # Own task, so cancelling any one caller leaves the others waiting on it
+            task = self._track_inflight(key, verification)
+        else:
+            logger.info("Joining in-flight verification for milestone %s", request.get('milestone_id'))
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _verification_key(request: Dict) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Key a request by (campaign_address, milestone_id, evidence_hash)
+
+        Used for in-flight dedup, the semantic cache and the result store.
+        Values are normalized to strings so integer milestone ids from the
+        backend still match entries reloaded from the store's TEXT columns.
+        """
+        return tuple(
+            None if request.get(name) is None else str(request.get(name))
+            for name in ('campaign_address', 'milestone_id', 'evidence_hash')
+        )
+
+    def _track_inflight(self, key: Tuple[Any, Any, Any], coro: Awaitable[FinalResult]) -> "asyncio.Task[FinalResult]":
+        """Run a verification as a shared task registered under key until it finishes"""
+        task = asyncio.ensure_future(coro)
+        self._inflight[key] = task
+
+        def _done(finished: asyncio.Task):
+            if self._inflight.get(key) is finished:
+                del self._inflight[key]
+            # Callers may all have been cancelled; mark the outcome retrieved either way
+            if not finished.cancelled():
+                finished.exception()
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _verify_milestone(self, request: Dict) -> FinalResult:
+        """
+        Run the full verification pipeline for a milestone submission
+
+        Args:
+            request: Verification request containing milestone data
+
+        Returns:
+            FinalResult containing verification result
+        """
+        prepared = await self._prepare_verification_bounded(request)
+        if isinstance(prepared, FinalResult):
+            return prepared
+
+        # Step 3: Combine results and make final decision
+        embedding, evidence_analysis, agent_verdict = prepared
+        try:
+            final_result = self.combine_results(evidence_analysis, agent_verdict)
+            self._complete_verification(request, embedding, final_result)
+        except Exception as e:
+            return self._verification_failed(request, e)
+        return final_result
+
+    async def _verify_milestone_batch(self, requests: List[Dict]) -> List[FinalResult]:
+        """
+        Run the verification pipeline for a batch of distinct milestone submissions
+
+        Milestones are analyzed concurrently and then scored together with a
+        single score_batch call.
+
+        Args:
+            requests: Verification requests containing milestone data
+
+        Returns:
+            List of FinalResult in request order
         """
+        prepared = await asyncio.gather(*(self._prepare_verification_bounded(request) for request in requests))
+
+        results = list(prepared)
+        pending = [i for i, item in enumerate(prepared) if not isinstance(item, FinalResult)]
+        if not pending:
+            return results
+
+        await prepare_score_batch()
         try:
-            logger.info(f"Starting verification for milestone {request.get('milestone_id')}")
+            combined = self.combine_results_batch(
+                [prepared[i][1] for i in pending],
+                [prepared[i][2] for i in pending]
+            )
+        except Exception:
+            # A malformed response must not fail the whole batch, so score it row by row
+            combined = [None] * len(pending)
+
+        for i, final_result in zip(pending, combined):
+            embedding, evidence_analysis, agent_verdict = prepared[i]
+            try:
+                if final_result is None:
+                    final_result = self.combine_results(evidence_analysis, agent_verdict)
+                self._complete_verification(requests[i], embedding, final_result)
+            except Exception as e:
+                final_result = self._verification_failed(requests[i], e)
+            results[i] = final_result
+        return results
+
+    async def _prepare_verification_bounded(
+        self, request: Dict
+    ) -> Union[FinalResult, Tuple[Optional[List[float]], EvidenceAnalysis, AgentVerdict]]:
+        """Run _prepare_verification in a verification slot"""
+        # Bounded so bursts can't exhaust the ASI:One connection pool
+        async with self._verification_slots:
+            return await self._prepare_verification(request)
+
+    async def _prepare_verification(
+        self, request: Dict
+    ) -> Union[FinalResult, Tuple[Optional[List[float]], EvidenceAnalysis, AgentVerdict]]:
+        """
+        Run the cache lookup, evidence analysis and agent verdict steps
+
+        Args:
+            request: Verification request containing milestone data
+
+        Returns:
+            FinalResult on a cache hit or failure, otherwise the description
+            embedding with the evidence analysis and agent verdict to combine
+        """
+        try:
+            logger.info("Starting verification for milestone %s", request.get('milestone_id'))
             
             # Extract request data
             milestone_id = request.get('milestone_id')
@@ -193,38 +999,89 @@ class MilestoneVerifierAgent:
             evidence_hash = request.get('evidence_hash')
             evidence_url = request.get('evidence_url')
             description = request.get('description', '')
-            
-            # Step 1: Analyze evidence using MeTTa knowledge graph
-            evidence_analysis = await self.analyze_evidence(
-                evidence_hash=evidence_hash,
-                evidence_url=evidence_url,
-                description=description
-            )
-            
-            # Step 2: Get ASI agent verdict using AgentVerse
-            agent_verdict = await self.get_agent_verdict(
-                milestone_id=milestone_id,
-                campaign_address=campaign_address,
-                evidence_analysis=evidence_analysis,
-                description=description
-            )
-            
-            # Step 3: Combine results and make final decision
-            final_result = self.combine_results(evidence_analysis, agent_verdict)
-            
-            logger.info(f"Verification completed for milestone {milestone_id}")
-            return final_result
+
+            # Short-circuit on a semantically equivalent, previously verified milestone
+            embedding = None
+            if self.semantic_cache is not None:
+                embedding = await self.semantic_cache.embed(description)
+                cached_result = self.semantic_cache.lookup(self._verification_key(request), embedding)
+                if cached_result is not None:
+                    logger.info("Semantic cache hit for milestone %s", milestone_id)
+                    return replace(cached_result, cached=True)
+
+            if self.parallel_verification:
+                # Steps 1 and 2 concurrently: the agent verdict is requested without the evidence analysis
+                evidence_analysis, agent_verdict = await asyncio.gather(
+                    self.analyze_evidence(
+                        evidence_hash=evidence_hash,
+                        evidence_url=evidence_url,
+                        description=description
+                    ),
+                    self.get_agent_verdict(
+                        milestone_id=milestone_id,
+                        campaign_address=campaign_address,
+                        evidence_analysis=None,
+                        description=description
+                    )
+                )
+            else:
+                # Step 1: Analyze evidence using MeTTa knowledge graph
+                evidence_analysis = await self.analyze_evidence(
+                    evidence_hash=evidence_hash,
+                    evidence_url=evidence_url,
+                    description=description
+                )
+
+                # Step 2: Get ASI agent verdict using AgentVerse
+                agent_verdict = await self.get_agent_verdict(
+                    milestone_id=milestone_id,
+                    campaign_address=campaign_address,
+                    evidence_analysis=evidence_analysis,
+                    description=description
+                )
+
+            return embedding, evidence_analysis, agent_verdict
             
         except Exception as e:
-            logger.error(f"Verification failed for milestone {request.get('milestone_id')}: {e}")
-            return {
-                "verdict": "uncertain",
-                "confidence": 0.0,
-                "reasoning": f"Verification failed: {str(e)}",
-                "error": str(e)
-            }
+            return self._verification_failed(request, e)
+
+    @staticmethod
+    def _verification_failed(request: Dict, error: Exception) -> FinalResult:
+        logger.error("Verification failed for milestone %s: %s", request.get('milestone_id'), error)
+        return FinalResult(
+            verdict="uncertain",
+            confidence=0.0,
+            reasoning=f"Verification failed: {str(error)}",
+            error=str(error)
+        )
+
+    def _complete_verification(self, request: Dict, embedding: Optional[List[float]], final_result: FinalResult):
+        """Cache a freshly combined verification result"""
+        if self.semantic_cache is not None:
+            scope = self._verification_key(request)
+            # Mock and error fallbacks must not be served as real verdicts later
+            if not final_result.from_fallback:
+                self.semantic_cache.store(scope, embedding, final_result)
+
+                if self.result_store is not None:
+                    persisted = self.result_store.put(
+                        scope, embedding, final_result,
+                        model_id=self.semantic_cache.model_id,
+                        expires_at=time.time() + self.semantic_cache.ttl_seconds
+                    )
+                    persisted.add_done_callback(self._log_persist_failure)
+
+        logger.info(
+            "Verification completed for milestone %s: %s (confidence=%.2f)",
+            request.get('milestone_id'), final_result.verdict, final_result.confidence
+        )
     
-    async def analyze_evidence(self, evidence_hash: str, evidence_url: str = None, description: str = "") -> Dict:
+    @staticmethod
+    def _log_persist_failure(future: asyncio.Future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Failed to persist verification result: %s", future.exception())
+
+    async def analyze_evidence(self, evidence_hash: str, evidence_url: str = None, description: str = "") -> EvidenceAnalysis:
         """
         Analyze evidence using MeTTa knowledge graph
         
@@ -234,63 +1091,62 @@ class MilestoneVerifierAgent:
             description: Milestone description
             
         Returns:
-            Dict containing evidence analysis
+            EvidenceAnalysis containing evidence analysis
         """
         try:
-            logger.info(f"Analyzing evidence: {evidence_hash}")
+            logger.info("Analyzing evidence: %s", evidence_hash)
             
             # Query MeTTa knowledge graph for evidence analysis
             query = {
                 "evidence_hash": evidence_hash,
                 "evidence_url": evidence_url,
                 "description": description,
-                "analysis_type": "milestone_verification"
+                "analysis_type": METTA_CONTEXT
             }
             
             # Use MeTTa client to analyze evidence
-            response = await self.metta_client.query(
-                query=query,
-                context="milestone_verification"
-            )
+            if self._metta_batcher is not None:
+                response = await self._metta_batcher.submit(query)
+            else:
+                target, context = await self._get_metta_target()
+                response = await target.query(query=query, **context)
             
             # Parse response
-            analysis = {
-                "relevance": response.get("relevance", 0.5),
-                "completeness": response.get("completeness", 0.5),
-                "authenticity": response.get("authenticity", 0.5),
-                "reasoning": response.get("reasoning", "Evidence analysis completed"),
-                "metadata": response.get("metadata", {})
-            }
+            analysis = EvidenceAnalysis(
+                relevance=response.get("relevance", 0.5),
+                completeness=response.get("completeness", 0.5),
+                authenticity=response.get("authenticity", 0.5),
+                reasoning=response.get("reasoning", "Evidence analysis completed"),
+                metadata=response.get("metadata", {}),
+                fallback=not METTA_AVAILABLE
+            )
             
-            logger.info(f"Evidence analysis completed: {analysis}")
+            logger.info(
+                "Evidence analysis completed for %s: relevance=%s completeness=%s authenticity=%s",
+                evidence_hash, analysis.relevance, analysis.completeness, analysis.authenticity
+            )
             return analysis
             
         except Exception as e:
-            logger.error(f"Evidence analysis failed: {e}")
-            return {
-                "relevance": 0.5,
-                "completeness": 0.5,
-                "authenticity": 0.5,
-                "reasoning": f"Evidence analysis failed: {str(e)}",
-                "metadata": {}
-            }
+            logger.error("Evidence analysis failed: %s", e)
+            return EvidenceAnalysis(reasoning=f"Evidence analysis failed: {str(e)}", fallback=True)
     
     async def get_agent_verdict(self, milestone_id: str, campaign_address: str, 
-                              evidence_analysis: Dict, description: str) -> Dict:
+                              evidence_analysis: Optional[EvidenceAnalysis], description: str) -> AgentVerdict:
         """
         Get ASI agent verdict using AgentVerse
         
         Args:
             milestone_id: Milestone identifier
             campaign_address: Campaign contract address
-            evidence_analysis: Results from evidence analysis
+            evidence_analysis: Results from evidence analysis (None when run in parallel with it)
             description: Milestone description
             
         Returns:
-            Dict containing agent verdict
+            AgentVerdict containing agent verdict
         """
         try:
-            logger.info(f"Getting agent verdict for milestone {milestone_id}")
+            logger.info("Getting agent verdict for milestone %s", milestone_id)
             
             # Prepare agent request
             agent_request = {
@@ -298,8 +1154,7 @@ class MilestoneVerifierAgent:
                 "context": {
                     "milestone_id": milestone_id,
                     "campaign_address": campaign_address,
-                    "description": description,
-                    "evidence_analysis": evidence_analysis
+                    "description": description
                 },
                 "parameters": {
                     "confidence_threshold": self.confidence_threshold,
@@ -307,29 +1162,55 @@ class MilestoneVerifierAgent:
                 }
             }
             
+            if evidence_analysis is not None:
+                agent_request["context"]["evidence_analysis"] = asdict(evidence_analysis)
+            
             # Send request to ASI:One chat protocol
             response = await self.call_asi_one_chat(agent_request)
             
             # Parse agent response
-            verdict = {
-                "approved": response.get("approved", False),
-                "confidence": response.get("confidence", 0.5),
-                "reasoning": response.get("reasoning", "Agent analysis completed"),
-                "recommendations": response.get("recommendations", [])
-            }
+            verdict = AgentVerdict(
+                approved=response.get("approved", False),
+                confidence=response.get("confidence", 0.5),
+                reasoning=response.get("reasoning", "Agent analysis completed"),
+                recommendations=response.get("recommendations", ()),
+                fallback=response.get("fallback", False)
+            )
             
-            logger.info(f"Agent verdict: {verdict}")
+            logger.info(
+                "Agent verdict for milestone %s: approved=%s confidence=%s",
+                milestone_id, verdict.approved, verdict.confidence
+            )
             return verdict
             
         except Exception as e:
-            logger.error(f"Agent verdict failed: {e}")
-            return {
-                "approved": False,
-                "confidence": 0.0,
-                "reasoning": f"Agent verdict failed: {str(e)}",
-                "recommendations": []
-            }
+            logger.error("Agent verdict failed: %s", e)
+            return AgentVerdict(
+                confidence=0.0,
+                reasoning=f"Agent verdict failed: {str(e)}",
+                fallback=True
+            )
     
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared ASI:One HTTP client, creating it on first use
+
+        The client keeps a pool of keep-alive connections (multiplexed over
+        HTTP/2 when h2 is installed) so requests skip the TCP/TLS handshake.
+
+        Returns:
+            Shared httpx.AsyncClient instance
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self._asi_base_url,
+                headers=self._asi_headers,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=httpx.Timeout(120.0)  # Increased timeout for complex AI processing
+            )
+        return self._http
+
     async def call_asi_one_chat(self, request: Dict) -> Dict:
         """
         Call ASI:One chat protocol for agent interaction
@@ -341,49 +1222,168 @@ class MilestoneVerifierAgent:
             Dict containing agent response
         """
         try:
-            # Use real ASI:One endpoint for hackathon prize eligibility
-            asi_endpoint = os.getenv('ASI_ENDPOINT', 'https://api.asi.one')
-            api_key = os.getenv('ASI_API_KEY')
-
-            if not api_key:
+            if not self._asi_api_key:
                 logger.warning("ASI_API_KEY not provided, falling back to mock for development")
                 logger.info("To enable real ASI integration, set ASI_API_KEY environment variable")
                 return self.get_mock_agent_response(request)
 
-            # Call real ASI:One chat API with proper authentication
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-                "X-API-Key": api_key,  # Additional auth header
-                "User-Agent": "AutoCrowd-MilestoneVerifier/1.0"
-            }
-
-            logger.info(f"Calling ASI:One chat API: {asi_endpoint}/chat/agent")
+            if not self._asi_breaker.allow_request():
+                logger.warning("ASI:One circuit breaker open, falling back to mock agent response")
+                return self.get_mock_agent_response(request)
 
-            # Call ASI:One chat protocol for real milestone verification
-            response = requests.post(
-                f"{asi_endpoint}/chat/agent",
-                json=request,
-                headers=headers,
-                timeout=120  # Increased timeout for complex AI processing
-            )
+            if self._asi_batcher is not None:
+                # The batch call records its outcome on the breaker once for all of its callers
+                result = await self._asi_batcher.submit(request)
+            else:
+                logger.info("Calling ASI:One chat API: %s", self._asi_endpoint)
 
-            response.raise_for_status()
-            result = response.json()
+                # Call ASI:One chat protocol for real milestone verification
+                result = await self._guard_asi_call(self._post_asi_chat(request))
 
             logger.info("Successfully received response from ASI:One chat protocol")
             return result
 
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"ASI:One API HTTP error: {e.response.status_code} - {e.response.text}")
+        except httpx.HTTPStatusError as e:
+            logger.error("ASI:One API HTTP error: %s - %s", e.response.status_code, e.response.text)
             return self.get_mock_agent_response(request)
-        except requests.exceptions.Timeout as e:
-            logger.error(f"ASI:One API timeout: {e}")
+        except (httpx.TimeoutException, asyncio.TimeoutError) as e:
+            logger.error("ASI:One API timeout: %s", e)
             return self.get_mock_agent_response(request)
         except Exception as e:
-            logger.error(f"ASI:One chat call failed: {e}")
+            logger.error("ASI:One chat call failed: %s", e)
             return self.get_mock_agent_response(request)
     
+    async def _guard_asi_call(self, call: Awaitable[Any]) -> Any:
+        """Await one ASI:One backend call and record its outcome on the circuit breaker"""
+        try:
+            result = await call
+        except asyncio.CancelledError:
+            # Not a backend failure, but a half-open trial must not stay claimed
+            self._asi_breaker.release_trial()
+            raise
+        except Exception:
+            self._asi_breaker.record_failure()
+            raise
+        self._asi_breaker.record_success()
+        return result
+
+    async def _post_asi_chat(self, payload: Dict) -> Any:
+        """
+        POST a payload to the ASI:One chat endpoint
+
+        Transient failures are retried up to max_retry_attempts times with
+        exponential backoff and jitter; the last error is re-raised.
+
+        Args:
+            payload: JSON request body
+
+        Returns:
+            Decoded JSON response
+        """
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(self.max_retry_attempts),
+            wait=wait_exponential_jitter(initial=1, max=10),
+            retry=retry_if_exception(is_retryable_asi_error),
+            reraise=True
+        ):
+            with attempt:
+                async with self._get_http_client().stream(
+                    "POST",
+                    ASI_CHAT_PATH,
+                    content=json_dumps(payload),
+                    headers={"Accept": "text/event-stream, application/json"}
+                ) as response:
+                    if response.is_error:
+                        await response.aread()
+                        response.raise_for_status()
+                    if response.headers.get("content-type", "").startswith("text/event-stream"):
+                        return await self._read_asi_event_stream(response)
+                    return json_loads(await response.aread())
+
+    async def _read_asi_event_stream(self, response: httpx.Response) -> Dict:
+        """
+        Merge streamed ASI:One server-sent events into a single response
+
+        Each `data:` frame carries a JSON object with some of the response
+        fields and is parsed as it arrives, so a large payload is never
+        buffered whole. The stream is read to the end, which keeps trailing
+        fields such as the reasoning and lets the connection go back to the
+        pool.
+
+        Args:
+            response: Open streaming response
+
+        Returns:
+            Dict containing the merged agent response
+        """
+        result = {}
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data and data != "[DONE]":
+                result.update(json_loads(data))
+        return result
+
+    async def _post_asi_chat_batch(self, requests: List[Dict]) -> List[Dict]:
+        """
+        Send several agent requests to ASI:One in a single chat call
+
+        Args:
+            requests: Agent request payloads
+
+        Returns:
+            List of agent responses in request order
+        """
+        logger.info("Calling ASI:One chat API with batch of %d: %s", len(requests), self._asi_endpoint)
+
+        result = await self._guard_asi_call(self._post_asi_chat({"requests": requests}))
+        if isinstance(result, dict):
+            result = result.get("responses", [])
+        return result
+
+    async def _query_metta_batch(self, queries: List[Dict]) -> List[Union[Dict, Exception]]:
+        """
+        Run several evidence queries against MeTTa
+
+        Uses the client's multi-query API when it has one, otherwise issues
+        the queries concurrently so that a failing query fails only itself.
+
+        Args:
+            queries: Evidence query payloads
+
+        Returns:
+            List of MeTTa responses, or the exception raised for a query, in query order
+        """
+        target, context = await self._get_metta_target()
+        batch_query = getattr(target, "batch_query", None)
+        if batch_query is not None:
+            return await batch_query(queries=queries, **context)
+        return await asyncio.gather(*(
+            target.query(query=query, **context)
+            for query in queries
+        ), return_exceptions=True)
+
+    async def _get_metta_target(self) -> Tuple[Any, Dict[str, str]]:
+        """
+        Return the object to send MeTTa queries to
+
+        When the SDK supports sessions, a single session bound to the
+        verification context is opened on first use and reused, so the
+        server prepares the context once instead of per query.
+
+        Returns:
+            Tuple of (session or client, extra query kwargs)
+        """
+        open_session = getattr(self.metta_client, "open_session", None)
+        if open_session is None:
+            return self.metta_client, {"context": METTA_CONTEXT}
+
+        async with self._metta_session_lock:
+            if self._metta_session is None:
+                self._metta_session = await open_session(context=METTA_CONTEXT)
+        return self._metta_session, {}
+
     def get_mock_agent_response(self, request: Dict) -> Dict:
         """
         Generate mock agent response for development/testing
@@ -395,32 +1395,29 @@ class MilestoneVerifierAgent:
             Dict containing mock response
         """
         # Simple mock logic based on request data
-        description = request.get("context", {}).get("description", "")
-        evidence_analysis = request.get("context", {}).get("evidence_analysis", {})
+        context = request.get("context", {})
+        description_length = len(context.get("description", ""))
+        evidence_analysis = context.get("evidence_analysis", {})
+        relevance = evidence_analysis.get("relevance", 0.5)
+        completeness = evidence_analysis.get("completeness", 0.5)
         
         # Calculate mock confidence based on description length and evidence analysis
-        base_confidence = 0.5
-        if description and len(description) > 50:
-            base_confidence += 0.2
-        if evidence_analysis.get("relevance", 0.5) > 0.7:
-            base_confidence += 0.2
-        if evidence_analysis.get("completeness", 0.5) > 0.7:
-            base_confidence += 0.1
-        
-        confidence = min(base_confidence, 1.0)
+        # (bools count as 0/1, so each bonus applies without branching)
+        confidence = min(
+            0.5 + 0.2 * (description_length > 50) + 0.2 * (relevance > 0.7) + 0.1 * (completeness > 0.7),
+            1.0
+        )
         approved = confidence >= self.confidence_threshold
         
         return {
             "approved": approved,
             "confidence": confidence,
-            "reasoning": f"Mock agent analysis: Description length={len(description)}, Evidence relevance={evidence_analysis.get('relevance', 0.5):.2f}",
-            "recommendations": [
-                "Consider providing more detailed evidence",
-                "Ensure milestone deliverables are clearly defined"
-            ]
+            "reasoning": _MOCK_REASONING(description_length, relevance),
+            "recommendations": _MOCK_RECOMMENDATIONS,
+            "fallback": True
         }
     
-    def combine_results(self, evidence_analysis: Dict, agent_verdict: Dict) -> Dict:
+    def combine_results(self, evidence_analysis: EvidenceAnalysis, agent_verdict: AgentVerdict) -> FinalResult:
         """
         Combine evidence analysis and agent verdict into final result
         
@@ -429,46 +1426,65 @@ class MilestoneVerifierAgent:
             agent_verdict: Agent verdict results
             
         Returns:
-            Dict containing final verification result
+            FinalResult containing final verification result
         """
-        # Weight the different components
-        evidence_weight = 0.4
-        agent_weight = 0.6
-        
-        # Calculate evidence score
-        evidence_score = (
-            evidence_analysis.get("relevance", 0.5) * 0.4 +
-            evidence_analysis.get("completeness", 0.5) * 0.3 +
-            evidence_analysis.get("authenticity", 0.5) * 0.3
-        )
-        
-        # Combine with agent verdict
-        combined_confidence = (
-            evidence_score * evidence_weight +
-            agent_verdict.get("confidence", 0.5) * agent_weight
+        # Weighted evidence score combined with agent verdict
+        combined_confidence = _combined_score(
+            evidence_analysis.relevance,
+            evidence_analysis.completeness,
+            evidence_analysis.authenticity,
+            agent_verdict.confidence
         )
         
         # Determine final verdict
         if (combined_confidence >= self.confidence_threshold and 
-            agent_verdict.get("approved", False)):
+            agent_verdict.approved):
             verdict = "approved"
         elif (combined_confidence < (1 - self.confidence_threshold) or 
-              not agent_verdict.get("approved", False)):
+              not agent_verdict.approved):
             verdict = "rejected"
         else:
             verdict = "uncertain"
         
-        return {
-            "verdict": verdict,
-            "confidence": combined_confidence,
-            "reasoning": f"{evidence_analysis.get('reasoning', '')}. {agent_verdict.get('reasoning', '')}",
-            "details": {
-                "evidence_analysis": evidence_analysis,
-                "agent_verdict": agent_verdict,
-                "combined_score": combined_confidence
-            }
-        }
+        return FinalResult(
+            verdict=verdict,
+            confidence=combined_confidence,
+            reasoning=f"{evidence_analysis.reasoning}. {agent_verdict.reasoning}",
+            evidence_analysis=evidence_analysis,
+            agent_verdict=agent_verdict
+        )
     
+    def combine_results_batch(self, evidence_analyses: List[EvidenceAnalysis],
+                              agent_verdicts: List[AgentVerdict]) -> List[FinalResult]:
+        """
+        Combine many evidence analyses and agent verdicts in one scoring pass
+
+        Args:
+            evidence_analyses: Evidence analysis results
+            agent_verdicts: Agent verdict results, aligned with evidence_analyses
+
+        Returns:
+            List of FinalResult in input order
+        """
+        scores = np.array([
+            (ea.relevance, ea.completeness, ea.authenticity, av.confidence)
+            for ea, av in zip(evidence_analyses, agent_verdicts)
+        ], dtype=np.float64).reshape(-1, 4)
+        approved = np.array([av.approved for av in agent_verdicts], dtype=np.bool_)
+
+        confidences, verdicts = score_batch(scores, approved, self.confidence_threshold)
+
+        return [
+            FinalResult(
+                verdict=VERDICT_LABELS[verdict],
+                confidence=float(confidence),
+                reasoning=f"{ea.reasoning}. {av.reasoning}",
+                evidence_analysis=ea,
+                agent_verdict=av
+            )
+            for ea, av, confidence, verdict in zip(evidence_analyses, agent_verdicts, confidences, verdicts)
+        ]
+
     async def start(self):
         """Start the agent"""
         try:
@@ -479,31 +1495,9 @@ class MilestoneVerifierAgent:
                 logger.info(f"Agent {ctx.agent.name} started successfully!")
                 logger.info(f"Agent address: {ctx.agent.address}")
 
-            @self.agent.on_message()
-            async def handle_verification_request(ctx: Context, sender: str, msg: Dict):
-                """Handle milestone verification requests"""
-                try:
-                    logger.info(f"Received verification request from {sender}: {msg}")
-
-                    # Process verification request
-                    result = await self.verify_milestone(msg)
-
-                    # Send response back
-                    await ctx.send(sender, {
-                        "type": "verification_result",
-                        "request_id": msg.get("request_id"),
-                        "result": result,
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-
-                except Exception as e:
-                    logger.error(f"Error processing verification request: {e}")
-                    await ctx.send(sender, {
-                        "type": "verification_error",
-                        "request_id": msg.get("request_id"),
-                        "error": str(e),
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
+            self.agent.on_message()(self.handle_verification_request)
+            if self._verification_batcher is not None:
+                await prepare_score_batch()
 
             # Start the real agent
             await self.agent.run()
@@ -515,7 +1509,20 @@ class MilestoneVerifierAgent:
         """Stop the agent"""
         try:
             logger.info(f"Stopping {self.agent_name} agent...")
-            # Add cleanup logic here
+            for batcher in (self._verification_batcher, self._metta_batcher, self._asi_batcher):
+                if batcher is not None:
+                    await batcher.close()
+            if self._http is not None:
+                await self._http.aclose()
+                self._http = None
+            if self._metta_session is not None:
+                close = getattr(self._metta_session, "close", None)
+                if close is not None:
+                    await close()
+                self._metta_session = None
+            if self.result_store is not None:
+                await asyncio.to_thread(self.result_store.close)
+                self.result_store = None
         except Exception as e:
             logger.error(f"Error stopping agent: {e}")
 
@@ -524,9 +1531,16 @@ def main():
     try:
         # Create and start the agent
         agent = MilestoneVerifierAgent()
+
+        async def run():
+            try:
+                await agent.start()
+            finally:
+                # Flushes queued result store writes and closes connections
+                await agent.stop()
         
         # Run the agent
-        asyncio.run(agent.start())
+        asyncio.run(run())
         
     except KeyboardInterrupt:
         logger.info("Agent stopped by user")